@@ -1,5 +1,7 @@
 import logging
+import logging.handlers
 import os
+import signal
 import sys
 import time
 from http import HTTPStatus
@@ -9,7 +11,18 @@ import telegram
 from dotenv import load_dotenv
 
 import exceptions
-from settings import ENDPOINT, HOMEWORK_VERDICTS, RETRY_PERIOD
+from settings import (
+    ENDPOINT,
+    HOMEWORK_VERDICTS,
+    LOG_BUFFER_CAPACITY,
+    LOG_DEDUP_PERIOD,
+    LOG_FILE_BUFFER_SIZE,
+    MAX_RETRY_PERIOD,
+    REQUEST_TIMEOUT,
+    RETRY_PERIOD,
+    SEND_MESSAGE_ATTEMPTS,
+    SEND_MESSAGE_TIMEOUT
+)
 
 load_dotenv()
 
@@ -20,6 +33,16 @@ TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
+STATUS_TEMPLATES = {
+    status: f'Изменился статус проверки работы "{{name}}". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+RESPONSE_REQUIRED_KEYS = (
+    ('homeworks', 'Ключ homeworks недоступен'),
+    ('current_date', 'Ключ current_date недоступен')
+)
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 formatter = logging.Formatter(
@@ -30,45 +53,106 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
+class DedupFilter(logging.Filter):
+    """Подавляет подряд идущие одинаковые записи лога ниже WARNING."""
+
+    def __init__(self, period=LOG_DEDUP_PERIOD):
+        """Запоминает период подавления повторов."""
+        super().__init__()
+        self.period = period
+        self.last = (None, None, 0)
+
+    def filter(self, record):
+        """Пропускает повтор не чаще одного раза за period секунд."""
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.levelno, record.getMessage())
+        now = time.time()
+        if key == self.last[:2] and now - self.last[2] < self.period:
+            return False
+        self.last = (*key, now)
+        return True
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """Файловый обработчик, сбрасывающий буфер только на ошибках."""
+
+    emitting_below_error = False
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=LOG_FILE_BUFFER_SIZE
+        )
+
+    def emit(self, record):
+        """Пишет запись в буфер файла, на диск - при уровне ERROR."""
+        self.emitting_below_error = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self.emitting_below_error = False
+
+    def flush(self):
+        """Сбрасывает буфер, кроме вызова из emit для записей ниже ERROR."""
+        if not self.emitting_below_error:
+            super().flush()
+
+
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    TOKENS = (
-        'PRACTICUM_TOKEN',
-        'TELEGRAM_TOKEN',
-        'TELEGRAM_CHAT_ID',
-        'ENDPOINT'
+    tokens = (
+        ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+        ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+        ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+        ('ENDPOINT', ENDPOINT)
     )
-    missing_tokens = []
-
-    global_vars = globals()
-
-    for key in TOKENS:
-        if not global_vars.get(key):
-            missing_tokens.append(key)
+    missing_tokens = [name for name, value in tokens if not value]
 
     if missing_tokens:
         missing_tokens_str = ', '.join(missing_tokens)
-        raise Exception(f'Недостающие переменные: {missing_tokens_str}')
+        raise exceptions.GlobalsError(
+            f'Недостающие переменные: {missing_tokens_str}'
+        )
 
 
 def send_message(bot, message):
     """Отправляет сообщение в Telegram чат."""
-    try:
-        logging.debug(f'Бот отправил сообщение: "{message}"')
-        return bot.send_message(TELEGRAM_CHAT_ID, message)
-    except telegram.error.TelegramError as error:
-        raise exceptions.SendMessageException(error)
+    logging.debug('Бот отправил сообщение: "%s"', message)
+    for attempt in range(1, SEND_MESSAGE_ATTEMPTS + 1):
+        try:
+            return bot.send_message(
+                TELEGRAM_CHAT_ID,
+                message,
+                timeout=SEND_MESSAGE_TIMEOUT
+            )
+        except telegram.error.RetryAfter as error:
+            if (
+                attempt == SEND_MESSAGE_ATTEMPTS
+                or error.retry_after > RETRY_PERIOD
+            ):
+                raise exceptions.SendMessageException(error)
+            logger.warning(
+                'Превышен лимит запросов к Telegram, повтор через %s с',
+                error.retry_after
+            )
+            time.sleep(error.retry_after)
+        except telegram.error.TelegramError as error:
+            raise exceptions.SendMessageException(error)
 
 
 def get_api_answer(timestamp):
     """Делает запрос к эндпоинту API сервиса Практикум.Домашка."""
-    current_timestamp = timestamp or int(time.time())
-    params = {'from_date': current_timestamp}
+    params = {'from_date': timestamp}
     try:
         homework_verdicts = requests.get(
             ENDPOINT,
             headers=HEADERS,
-            params=params
+            params=params,
+            timeout=REQUEST_TIMEOUT
         )
     except Exception as error:
         message = f'Эндпоинт {ENDPOINT} недоступен: {error}'
@@ -80,7 +164,7 @@ def get_api_answer(timestamp):
         raise exceptions.GetAPIAnswerException(message)
     try:
         return homework_verdicts.json()
-    except Exception as error:
+    except ValueError as error:
         message = f'Ошибка преобразования к формату json: {error}'
         logger.error(message)
         raise exceptions.GetAPIAnswerException(message)
@@ -96,12 +180,7 @@ def check_response(response):
         logger.error(message)
         raise TypeError(message)
 
-    error_messages = [
-        ('homeworks', 'Ключ homeworks недоступен'),
-        ('current_date', 'Ключ current_date недоступен')
-    ]
-
-    for key, error_message in error_messages:
+    for key, error_message in RESPONSE_REQUIRED_KEYS:
         if key not in response:
             logger.error(error_message)
             raise exceptions.CheckResponseException(error_message)
@@ -114,73 +193,96 @@ def check_response(response):
         )
         logger.error(message)
         raise TypeError(message)
+
+    current_date = response['current_date']
+    if not isinstance(current_date, int):
+        message = (
+            f'В ответе от API current_date не является числом. '
+            f'Получен: {type(current_date)}'
+        )
+        logger.error(message)
+        raise TypeError(message)
     return homeworks_list
 
 
 def parse_status(homework):
     """Извлекает из информации о конкретной домашке её статус."""
-    if 'homework_name' not in homework:
-        message = 'Ключ homework_name недоступен'
-        logger.error(message)
-        raise KeyError(message)
-
-    if 'status' not in homework:
-        message = 'Ключ status недоступен'
+    try:
+        homework_name = homework['homework_name']
+        homework_status = homework['status']
+    except KeyError as error:
+        message = f'Ключ {error.args[0]} недоступен'
         logger.error(message)
-        raise KeyError(message)
-
-    homework_name = homework['homework_name']
-    homework_status = homework['status']
+        raise KeyError(message) from error
 
-    if homework_status in HOMEWORK_VERDICTS:
-        verdict = HOMEWORK_VERDICTS[homework_status]
-        return (
-            f'Изменился статус проверки работы '
-            f'"{homework_name}". {verdict}'
+    template = STATUS_TEMPLATES.get(homework_status)
+    if template is None:
+        raise exceptions.ParseStatusException(
+            f'Передан неизвестный статус домашней работы "{homework_status}"'
         )
-    raise exceptions.ParseStatusException(
-        f'Передан неизвестный статус домашней работы "{homework_status}"'
-    )
+    return template.format(name=homework_name)
 
 
 def initialize_logging():
     """Настройка логирования."""
+    log_format = '%(asctime)s %(levelname)s - %(message)s'
+    file_handler = BufferedFileHandler('homework.log')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('homework.log'),
+            buffered_handler,
         ]
     )
+    for log_filter in logger.filters[:]:
+        if isinstance(log_filter, DedupFilter):
+            logger.removeFilter(log_filter)
+    logger.addFilter(DedupFilter())
 
 
-def process_homework(
-    bot, homework,
-    previous_status,
-    previous_name,
-    previous_error
-):
-    """Обрабатывает информацию о домашней работе отправляет сообщение."""
+def process_homework(homework, previous_statuses):
+    """Возвращает название и сообщение, если статус работы изменился."""
     homework_status = parse_status(homework)
     homework_name = homework['homework_name']
 
-    if (
-        previous_status == homework_status
-        and previous_name == homework_name
-    ):
+    if previous_statuses.get(homework_name) == homework_status:
         logger.info(homework_status)
-    else:
-        previous_status = homework_status
-        previous_name = homework_name
+        return None
+    return homework_name, homework_status
 
-        if previous_error:
-            send_message(bot, previous_error)
-            previous_error = None
 
-        send_message(bot, homework_status)
+def process_homeworks(bot, homeworks, previous_statuses, previous_error):
+    """Отправляет одним сообщением изменившиеся статусы и ошибки работ."""
+    changed = []
+    homework_errors = []
+    for homework in homeworks:
+        try:
+            change = process_homework(homework, previous_statuses)
+        except Exception as error:
+            message = f'Сбой в работе программы: {error}'
+            logger.error(message)
+            homework_errors.append(message)
+            continue
+        if change:
+            changed.append(change)
+
+    messages = [message for _, message in changed] + homework_errors
+    if not messages:
+        return previous_error
 
-    return previous_status, previous_name, previous_error
+    if previous_error:
+        messages.insert(0, previous_error)
+    send_message(bot, '\n\n'.join(messages))
+    previous_statuses.update(changed)
+    return None
 
 
 def send_error_message(bot, error_message):
@@ -188,14 +290,26 @@ def send_error_message(bot, error_message):
     try:
         send_message(bot, error_message)
     except exceptions.SendMessageException as error:
-        logger.error(f'Ошибка отправки сообщения: {error}')
+        logger.error('Ошибка отправки сообщения: %s', error)
+
+
+def get_retry_period(failures):
+    """Возвращает паузу перед следующим запросом к API.
+
+    failures - число подряд неудачных опросов: ошибок запроса к API
+    или отправки сообщения. Ошибки в данных отдельных домашних работ
+    не временные и паузу не увеличивают.
+    """
+    if not failures:
+        return RETRY_PERIOD
+    return min(RETRY_PERIOD * 2 ** (failures - 1), MAX_RETRY_PERIOD)
 
 
 def main():
     """Основная логика работы бота."""
     try:
         check_tokens()
-    except Exception as error:
+    except exceptions.GlobalsError as error:
         logger.critical(str(error))
         sys.exit(1)
 
@@ -203,43 +317,44 @@ def main():
     initialize_logging()
 
     timestamp = int(time.time())
-    previous_status = None
+    previous_statuses = {}
     previous_error = None
-    previous_name = None
+    failures = 0
 
     while True:
         try:
             response = get_api_answer(timestamp)
             homeworks = check_response(response)
-            timestamp = response.get('current_date')
             if not homeworks:
                 logger.info('Статус не обновлен')
             else:
-                for homework in homeworks:
-                    (
-                        previous_status,
-                        previous_name,
-                        previous_error
-                    ) = process_homework(
-                        bot, homework,
-                        previous_status,
-                        previous_name,
-                        previous_error
-                    )
+                previous_error = process_homeworks(
+                    bot, homeworks,
+                    previous_statuses,
+                    previous_error
+                )
+            timestamp = response['current_date']
+            failures = 0
 
         except exceptions.SendMessageException as error:
             message = f'Ошибка отправки сообщения: {error}'
             logger.error(message)
             previous_error = message
+            failures += 1
             send_error_message(bot, message)
         except Exception as error:
             message = f'Сбой в работе программы: {error}'
             logger.error(message)
             previous_error = message
+            failures += 1
             send_error_message(bot, message)
-        finally:
-            time.sleep(RETRY_PERIOD)
+
+        retry_period = get_retry_period(failures)
+        time.sleep(retry_period)
 
 
 if __name__ == '__main__':
+    # logging.shutdown() сбрасывает буфер лога при выходе, поэтому SIGTERM
+    # переводим в штатное завершение интерпретатора.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     main()
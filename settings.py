@@ -1,4 +1,11 @@
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = 3600
+REQUEST_TIMEOUT = (5, 30)
+SEND_MESSAGE_TIMEOUT = 10
+SEND_MESSAGE_ATTEMPTS = 2
+LOG_BUFFER_CAPACITY = 200
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_DEDUP_PERIOD = 3600
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 
 HOMEWORK_VERDICTS = {
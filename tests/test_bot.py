@@ -772,6 +772,317 @@ class TestHomework:
                     'возникновении ошибки отправки сообщения в Телеграм.'
                 ) from e
 
+    def test_send_message_retry_after(self, monkeypatch, homework_module):
+        class MockedBotWithRetryAfter(utils.MockTelegramBot):
+            def __init__(self, failures, retry_after, **kwargs):
+                super().__init__(**kwargs)
+                self.failures = failures
+                self.retry_after = retry_after
+                self.calls = 0
+
+            def send_message(self, *args, **kwargs):
+                self.calls += 1
+                if self.calls <= self.failures:
+                    raise telegram.error.RetryAfter(self.retry_after)
+                return super().send_message(*args, **kwargs)
+
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        bot = MockedBotWithRetryAfter(failures=1, retry_after=5)
+        homework_module.send_message(bot, 'Test_message_check')
+        assert bot.calls == 2, (
+            'Убедитесь, что после `RetryAfter` сообщение отправляется '
+            'повторно один раз.'
+        )
+        assert sleeps == [5], (
+            'Убедитесь, что перед повтором выдерживается пауза '
+            '`retry_after`.'
+        )
+
+        sleeps.clear()
+        bot = MockedBotWithRetryAfter(failures=2, retry_after=5)
+        with pytest.raises(homework_module.exceptions.SendMessageException):
+            homework_module.send_message(bot, 'Test_message_check')
+        assert bot.calls == 2, (
+            'Убедитесь, что после повторного `RetryAfter` отправка '
+            'прекращается.'
+        )
+
+        sleeps.clear()
+        bot = MockedBotWithRetryAfter(failures=1, retry_after=10000)
+        with pytest.raises(homework_module.exceptions.SendMessageException):
+            homework_module.send_message(bot, 'Test_message_check')
+        assert bot.calls == 1 and not sleeps, (
+            'Убедитесь, что при `retry_after` больше `RETRY_PERIOD` '
+            'отправка сразу завершается ошибкой без паузы.'
+        )
+
+    def test_process_homeworks_sends_changes_before_error(self, monkeypatch,
+                                                          homework_module):
+        sent = []
+        monkeypatch.setattr(
+            homework_module,
+            'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        homeworks = [
+            {'homework_name': 'hw1', 'status': 'approved'},
+            {'homework_name': 'hw2', 'status': 'unknown'},
+            {'homework_name': 'hw3', 'status': 'rejected'},
+        ]
+        previous_statuses = {}
+
+        result = homework_module.process_homeworks(
+            None, homeworks, previous_statuses, 'Сбой'
+        )
+        assert result is None
+        assert len(sent) == 1, (
+            'Убедитесь, что все изменения статусов отправляются одним '
+            'сообщением.'
+        )
+        assert sent[0].startswith('Сбой'), (
+            'Убедитесь, что сообщение о предыдущей ошибке отправляется '
+            'в том же сообщении, что и новые статусы.'
+        )
+        assert '"hw1"' in sent[0] and '"hw3"' in sent[0], (
+            'Убедитесь, что ошибка в одной домашней работе не мешает '
+            'отправить изменения статусов остальных.'
+        )
+        assert '"unknown"' in sent[0], (
+            'Убедитесь, что ошибка в домашней работе отправляется в том же '
+            'сообщении, что и новые статусы.'
+        )
+        assert set(previous_statuses) == {'hw1', 'hw3'}
+
+    def test_main_moves_timestamp_after_parse_error(self, monkeypatch,
+                                                    random_timestamp,
+                                                    homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+
+        timestamps = []
+        sent = []
+
+        def mock_get_api_answer(timestamp):
+            timestamps.append(timestamp)
+            return {
+                'homeworks': [{'homework_name': 'hw1', 'status': 'unknown'}],
+                'current_date': random_timestamp + len(timestamps)
+            }
+
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == 2:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(
+            homework_module,
+            'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert timestamps[1] == random_timestamp + 1, (
+            'Убедитесь, что после ошибки в данных домашней работы '
+            'следующий запрос использует новый `current_date`.'
+        )
+        assert sleeps == [600, 600], (
+            'Убедитесь, что ошибка в данных домашней работы не увеличивает '
+            'паузу между запросами.'
+        )
+
+    def test_process_homeworks_keeps_statuses_on_send_error(self,
+                                                            monkeypatch,
+                                                            homework_module):
+        def mock_send_message(bot, message):
+            raise homework_module.exceptions.SendMessageException('error')
+
+        monkeypatch.setattr(
+            homework_module, 'send_message', mock_send_message
+        )
+        previous_statuses = {}
+
+        with pytest.raises(homework_module.exceptions.SendMessageException):
+            homework_module.process_homeworks(
+                None,
+                [{'homework_name': 'hw1', 'status': 'approved'}],
+                previous_statuses,
+                None
+            )
+        assert previous_statuses == {}, (
+            'Убедитесь, что статус работы запоминается только после '
+            'успешной отправки сообщения.'
+        )
+
+    def test_check_response_null_current_date(self, homework_module):
+        response = {'homeworks': [], 'current_date': None}
+        with pytest.raises(TypeError):
+            homework_module.check_response(response)
+
+    def test_dedup_filter_keeps_errors(self, homework_module):
+        dedup_filter = homework_module.DedupFilter()
+
+        def make_record(level):
+            return logging.LogRecord(
+                'homework', level, __file__, 0, 'Сообщение', None, None
+            )
+
+        assert dedup_filter.filter(make_record(logging.INFO))
+        assert not dedup_filter.filter(make_record(logging.INFO)), (
+            'Убедитесь, что повторная запись уровня `INFO` подавляется.'
+        )
+        assert dedup_filter.filter(make_record(logging.ERROR))
+        assert dedup_filter.filter(make_record(logging.ERROR)), (
+            'Убедитесь, что повторные записи уровня `ERROR` не подавляются.'
+        )
+
+    def test_buffered_file_handler(self, tmp_path, homework_module):
+        log_file = tmp_path / 'homework.log'
+        file_handler = homework_module.BufferedFileHandler(
+            log_file, mode='w', errors='replace'
+        )
+
+        def make_record(level, msg):
+            return logging.LogRecord(
+                'homework', level, __file__, 0, msg, None, None
+            )
+
+        file_handler.emit(make_record(logging.INFO, 'info'))
+        assert log_file.read_text() == '', (
+            'Убедитесь, что записи ниже `ERROR` остаются в буфере.'
+        )
+        file_handler.emit(make_record(logging.ERROR, 'error'))
+        assert log_file.read_text() == 'info\nerror\n', (
+            'Убедитесь, что запись уровня `ERROR` сбрасывает буфер на диск.'
+        )
+        assert file_handler.stream.errors == 'replace'
+
+        file_handler.close()
+        file_handler.emit(make_record(logging.ERROR, 'closed'))
+        assert file_handler.stream is None, (
+            'Убедитесь, что закрытый обработчик в режиме `w` не открывает '
+            'файл заново.'
+        )
+        assert log_file.read_text() == 'info\nerror\n'
+
+    def test_get_retry_period(self, homework_module):
+        func_name = 'get_retry_period'
+        utils.check_function(homework_module, func_name, 1)
+
+        expected = [600, 600, 1200, 2400, 3600, 3600]
+        result = [
+            homework_module.get_retry_period(failures)
+            for failures in range(len(expected))
+        ]
+        assert result == expected, (
+            f'Проверьте, что функция `{func_name}` удваивает паузу после '
+            'каждой повторной ошибки и ограничивает её `MAX_RETRY_PERIOD`.'
+        )
+
+    def test_main_resets_retry_period_after_success(self, monkeypatch,
+                                                    random_timestamp,
+                                                    homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+
+        answers = iter([
+            requests.RequestException('Something wrong'),
+            requests.RequestException('Something wrong'),
+            {'homeworks': [], 'current_date': random_timestamp},
+        ])
+
+        def mock_get_api_answer(timestamp):
+            answer = next(answers)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == 3:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert sleeps == [600, 1200, 600], (
+            'Убедитесь, что после успешного запроса пауза между запросами '
+            'возвращается к `RETRY_PERIOD`.'
+        )
+
+    def test_main_exits_without_sleep(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+
+        def mock_get_api_answer(timestamp):
+            raise SystemExit(0)
+
+        def mock_sleep(secs):
+            raise AssertionError(
+                'Убедитесь, что при завершении процесса `main()` не ждёт '
+                'паузу перед следующим запросом.'
+            )
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(SystemExit):
+            homework_module.main()
+
+    def test_main_homework_error_does_not_back_off(self, monkeypatch,
+                                                   random_timestamp,
+                                                   homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+
+        polls = []
+
+        def mock_get_api_answer(timestamp):
+            polls.append(timestamp)
+            return {
+                'homeworks': [{'homework_name': 'hw1', 'status': 'unknown'}],
+                'current_date': random_timestamp + len(polls)
+            }
+
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == 4:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert sleeps == [self.RETRY_PERIOD] * 4, (
+            'Убедитесь, что ошибки в данных домашних работ не считаются '
+            'сбоями опроса и не увеличивают паузу между запросами.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             utils.check_docstring(homework_module, func)